@@ -21,8 +21,29 @@ except Exception:  # pragma: no cover - fallback when flasgger is missing
 
 
 from flask import Flask, g, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:  # orjson이 없으면 stdlib json 기반 기본 provider 사용
+    import orjson
+except Exception:  # pragma: no cover - fallback when orjson is missing
+    orjson = None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """요청 파싱과 jsonify 직렬화를 모두 orjson으로 처리하는 provider."""
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def dumps(self, obj, **kwargs):
+        # OPT_PASSTHROUGH_DATETIME으로 datetime을 default 훅(http_date)에
+        # 넘겨, orjson의 ISO 8601이 아니라 기존 provider와 동일한
+        # HTTP date 형식을 유지한다 (Decimal 등도 같은 훅이 처리)
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode()
+
 from . import db
 from .routes import main as main_blueprint
 from .routes.bike_logs import bp as bike_logs_bp
@@ -39,6 +60,8 @@ load_dotenv()
 
 def create_app(test_config=None):
     app = Flask(__name__, instance_relative_config=True)
+    if orjson is not None:
+        app.json = ORJSONProvider(app)
 
     # basic logging setup
     if not app.logger.handlers:
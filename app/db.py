@@ -8,8 +8,77 @@ from flask.cli import with_appcontext
 
 SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "schema.sql")
 
+# 자주 실행되는 단순 조회/갱신 쿼리는 서버측 prepared statement로 등록해
+# 매 실행마다 드는 parse/plan 비용을 제거한다 (point query에서는 parse 비용이
+# execute 비용과 비슷한 수준)
+PREPARED_STATEMENTS = {
+    "get_user_profile": """
+        PREPARE get_user_profile (int) AS
+        SELECT u.id, u.username, u.email, u.profile_image_url, u.points, u.level, u.experience_points,
+               ul.level_name, ul.description, ul.benefits, u.created_at
+        FROM users u
+        LEFT JOIN user_levels ul ON u.level = ul.level
+        WHERE u.id = $1
+    """,
+    "inc_user_exp": """
+        PREPARE inc_user_exp (int, int) AS
+        UPDATE users SET experience_points = GREATEST(0, experience_points + $1)
+        WHERE id = $2
+        RETURNING experience_points
+    """,
+    "insert_user": """
+        PREPARE insert_user (text, text, text, text, boolean) AS
+        INSERT INTO users (kakao_id, username, email, profile_image_url, is_admin)
+        VALUES ($1, $2, $3, $4, $5)
+        RETURNING id
+    """,
+    "upsert_test_user": """
+        PREPARE upsert_test_user (text, text, text, boolean) AS
+        INSERT INTO users (kakao_id, username, email, is_admin)
+        VALUES ($1, $2, $3, $4)
+        ON CONFLICT (kakao_id) DO UPDATE SET username = users.username
+        RETURNING id, username, email, is_admin
+    """,
+}
+
+
+# 등록은 문장을 하나로 합쳐 커넥션당 한 번의 round-trip으로 끝낸다.
+# 선행 DEALLOCATE ALL 덕분에 같은 커넥션에 다시 호출해도 안전하다(멱등).
+_PREPARE_ALL_SQL = "DEALLOCATE ALL;\n" + ";\n".join(
+    stmt.strip() for stmt in PREPARED_STATEMENTS.values()
+)
+
+
+def _prepare_statements(conn):
+    """커넥션에 핫패스 prepared statement들을 한 번의 round-trip으로 등록한다."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute(_PREPARE_ALL_SQL)
+    except Exception as e:
+        # 스키마가 아직 없는 초기화 시점 등에는 등록이 실패할 수 있다
+        print(f"Preparing statements failed: {e}")
+
+
+# 테스트 전용 공유 커넥션 (크기 1짜리 풀). 앱을 테스트마다 새로 만들어도
+# TCP + 인증 핸드셰이크를 세션당 한 번만 지불하고, 픽스처의 INSERT와 테스트
+# 클라이언트 요청이 같은 트랜잭션을 보게 되어 BEGIN/ROLLBACK 격리가 가능하다.
+_test_conn = None
+_test_conn_dsn = None
+
+
 def get_db():
+    global _test_conn, _test_conn_dsn
     if "db" not in g:
+        testing = current_app.config.get("TESTING")
+        if testing:
+            dsn = current_app.config.get("DATABASE_URL")
+            if (
+                _test_conn is not None
+                and not _test_conn.closed
+                and _test_conn_dsn == dsn
+            ):
+                g.db = _test_conn
+                return g.db
         try:
             # DATABASE_URL 우선 사용
             database_url = current_app.config.get("DATABASE_URL") or os.environ.get("DATABASE_URL")
@@ -57,17 +126,21 @@ def get_db():
                         raise
             
             g.db.autocommit = True
-            
+            _prepare_statements(g.db)
+            if testing:
+                _test_conn = g.db
+                _test_conn_dsn = current_app.config.get("DATABASE_URL")
+
         except Exception as e:
             print(f"Database connection failed: {e}")
             raise
-            
+
     return g.db
 
 
 def close_db(e=None):
     db = g.pop("db", None)
-    if db is not None:
+    if db is not None and db is not _test_conn:
         db.close()
 
 
@@ -93,3 +166,7 @@ def init_app(app):
     if app.config.get("TESTING"):
         with app.app_context():
             init_db()
+            # 빈 DB였다면 위 init_db가 쓴 커넥션은 스키마 생성 전에 열려
+            # PREPARE가 전부 실패한 채 _test_conn으로 캐시돼 있다.
+            # 스키마가 생긴 지금 같은 커넥션에 다시 등록한다(멱등).
+            _prepare_statements(get_db())
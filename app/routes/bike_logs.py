@@ -227,7 +227,7 @@ def create_bike_log():
 
         log = cur.fetchone()
 
-    return make_response(dict(log), 201)
+    return make_response(log, 201)
 
 
 @bp.route("/users/bike-logs", methods=["GET"])
@@ -599,7 +599,7 @@ def verify_bike_log(log_id):
                 ),
             )
 
-    return make_response(dict(updated_log))
+    return make_response(updated_log)
 
 
 @bp.route("/users/bike-logs/<int:log_id>", methods=["GET"])
@@ -698,7 +698,7 @@ def get_bike_log_detail(log_id):
         if log["user_id"] != user_id:
             return make_response({"error": "access denied"}, 403)
 
-    return make_response(dict(log))
+    return make_response(log)
 
 
 @bp.route("/users/bike-logs/today/count", methods=["GET"])
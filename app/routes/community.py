@@ -119,7 +119,7 @@ def list_posts():
         )
         posts = cur.fetchall()
 
-    return make_response([dict(post) for post in posts])
+    return make_response(posts)
 
 
 @bp.route("/community/posts", methods=["POST"])
@@ -351,7 +351,7 @@ def create_comment(post_id):
             (exp, user_id),
         )
 
-    return make_response(dict(comment), 201)
+    return make_response(comment, 201)
 
 
 @bp.route("/community/posts/<int:post_id>/like", methods=["POST"])
@@ -501,7 +501,7 @@ def get_safety_reports():
         )
         reports = cur.fetchall()
 
-    return make_response([dict(report) for report in reports])
+    return make_response(reports)
 
 
 @bp.route("/users/safety-reports", methods=["POST"])
@@ -617,4 +617,4 @@ def create_safety_report():
         )
         report = cur.fetchone()
 
-    return make_response(dict(report), 201)
+    return make_response(report, 201)
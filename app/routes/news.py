@@ -118,7 +118,7 @@ def update_news(news_id):
         result = cur.fetchone()
         if not result:
             return make_response({"error": "news not found"}, 404)
-    return make_response(dict(result))
+    return make_response(result)
 
 
 @bp.route("/admin/news/<int:news_id>", methods=["DELETE"])
@@ -198,4 +198,4 @@ def get_news(news_id):
         row = cur.fetchone()
         if not row:
             return make_response({"error": "news not found"}, 404)
-    return make_response(dict(row))
+    return make_response(row)
@@ -3,7 +3,7 @@ import os
 from datetime import date, datetime
 
 import aiohttp
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request
 
 from ..db import get_db
 from ..utils.auth import admin_required, get_current_user_id, jwt_required
@@ -291,7 +291,7 @@ def update_quiz(quiz_id):
         if not result:
             return make_response({"error": "quiz not found"}, 404)
 
-    return make_response(dict(result))
+    return make_response(result)
 
 
 @bp.route("/admin/quizzes/<int:quiz_id>", methods=["DELETE"])
@@ -521,6 +521,9 @@ def attempt_quiz(quiz_id):
                   experience_earned:
                     type: integer
                     example: 5
+                  experience_points_after:
+                    type: integer
+                    example: 15
       400:
         description: 잘못된 요청
       401:
@@ -571,9 +574,11 @@ def attempt_quiz(quiz_id):
                 UPDATE users
                 SET experience_points = experience_points + %s
                 WHERE id = %s
+                RETURNING experience_points
                 """,
                 (exp, user_id),
             )
+            exp_after = cur.fetchone()["experience_points"]
 
             # 보상 기록
             cur.execute(
@@ -590,7 +595,10 @@ def attempt_quiz(quiz_id):
     response_data = {"is_correct": is_correct, "reward_given": reward_given}
 
     if reward_given:
-        response_data.update({"experience_earned": exp})
+        # UPDATE ... RETURNING으로 받은 잔액이라 추가 SELECT 없이 내려준다
+        response_data.update(
+            {"experience_earned": exp, "experience_points_after": exp_after}
+        )
 
     return make_response(response_data)
 
@@ -686,7 +694,8 @@ def generate_quiz():
     if not prompt:
         return make_response({"error": "prompt required"}, 400)
 
-    api_key = os.environ.get("CLOVA_API_KEY")
+    # 설정 우선, 없으면 환경변수 (테스트는 config로 주입해 env 전역 변경을 피한다)
+    api_key = current_app.config.get("CLOVA_API_KEY") or os.environ.get("CLOVA_API_KEY")
     if not api_key:
         return make_response({"error": "CLOVA_API_KEY not set"}, 500)
 
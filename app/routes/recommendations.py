@@ -91,7 +91,7 @@ def create_course_recommendation():
         )
         rec = cur.fetchone()
 
-    return make_response(dict(rec), 201)
+    return make_response(rec, 201)
 
 
 @bp.route("/users/course-recommendations", methods=["GET"])
@@ -124,7 +124,7 @@ def list_course_recommendations():
             (user_id,),
         )
         rows = cur.fetchall()
-    return make_response([dict(row) for row in rows])
+    return make_response(rows)
 
 
 @bp.route("/users/course-recommendations/week/count", methods=["GET"])
@@ -288,7 +288,7 @@ def verify_course_recommendation(rec_id: int):
                 ),
             )
 
-    return make_response(dict(updated))
+    return make_response(updated)
 
 
 @bp.route("/admin/course-recommendations", methods=["GET"])
@@ -315,4 +315,4 @@ def list_all_course_recommendations():
     with db.cursor() as cur:
         cur.execute("SELECT * FROM course_recommendations ORDER BY created_at DESC")
         rows = cur.fetchall()
-    return make_response([dict(row) for row in rows])
+    return make_response(rows)
@@ -66,4 +66,4 @@ def get_user_rewards():
             (user_id,),
         )
         rewards = cur.fetchall()
-    return make_response([dict(r) for r in rewards])
+    return make_response(rewards)
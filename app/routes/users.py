@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 import aiohttp
+import psycopg2.extras
 from flask import Blueprint, request
 
 from ..db import get_db
@@ -17,12 +22,92 @@ from ..utils.auth import (
     refresh_jwt_token,
 )
 from ..utils.responses import make_response
+from ..utils.schemas import levels_response, profile_response, settings_response
 
 bp = Blueprint("users", __name__)
 
 KAKAO_REST_API_KEY = os.environ.get("KAKAO_REST_API_KEY")
 KAKAO_REDIRECT_URI = os.environ.get("KAKAO_REDIRECT_URI")
 
+# 환경은 프로세스 시작 후 바뀌지 않으므로 import 시점에 한 번만 판별
+_IS_PROD = os.environ.get("FLASK_ENV") == "production"
+
+# user_levels는 배포할 때나 바뀌는 정적 데이터라 TTL을 두고 프로세스 내에 캐시한다
+_LEVELS_CACHE_TTL = 300  # seconds
+_levels_cache: Dict[str, Any] = {"rows": None, "loaded_at": 0.0}
+
+
+def _get_levels():
+    """user_levels 전체를 캐시에서 반환한다 (TTL 만료 시에만 DB 조회)."""
+    now = time.monotonic()
+    if (
+        _levels_cache["rows"] is None
+        or now - _levels_cache["loaded_at"] > _LEVELS_CACHE_TTL
+    ):
+        db = get_db()
+        with db.cursor() as cur:
+            cur.execute("SELECT * FROM user_levels ORDER BY level")
+            _levels_cache["rows"] = cur.fetchall()
+        _levels_cache["loaded_at"] = now
+    return _levels_cache["rows"]
+
+
+# 카카오 outbound 호출 동시 실행 상한. 로그인 폭주 시 무제한으로 커넥션을
+# 열어 rate-limit/커넥터 고갈로 무너지는 대신 완만하게 처리되도록 한다.
+_KAKAO_MAX_CONCURRENCY = 20
+_kakao_sem = threading.Semaphore(_KAKAO_MAX_CONCURRENCY)
+
+# 요청마다 asyncio.run이 이벤트 루프를 새로 만들고 버리지 않도록
+# 데몬 스레드 하나에서 공유 루프를 돌리고 코루틴만 제출한다.
+# import 시점에 스레드를 띄우면 Gunicorn --preload처럼 import 후 fork하는
+# 환경에서 루프 스레드가 자식 프로세스에 복제되지 않아 모든 로그인이
+# 조용히 멈추므로, 워커 프로세스 안의 첫 호출 때 지연 시작한다.
+_kakao_loop = None
+_kakao_loop_lock = threading.Lock()
+
+
+def _get_kakao_loop():
+    """공유 카카오 이벤트 루프를 (필요하면 시작해서) 돌려준다."""
+    global _kakao_loop
+    loop = _kakao_loop
+    if loop is None:
+        with _kakao_loop_lock:
+            loop = _kakao_loop
+            if loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, daemon=True, name="kakao-io-loop"
+                ).start()
+                _kakao_loop = loop
+    return loop
+
+
+def _reset_kakao_loop():
+    """fork 직후 자식에서 죽은 루프 참조를 버려 다음 호출이 새로 시작하게 한다."""
+    global _kakao_loop
+    _kakao_loop = None
+
+
+# 부모에서 이미 루프를 시작한 뒤 fork되는 경우까지 방어
+os.register_at_fork(after_in_child=_reset_kakao_loop)
+
+
+def _call_kakao(coro):
+    """카카오 API 코루틴을 공유 루프에서 동시성 상한 안에서 실행한다."""
+    with _kakao_sem:
+        return asyncio.run_coroutine_threadsafe(coro, _get_kakao_loop()).result()
+
+
+# DB round-trip을 CPU 작업과 겹치기 위한 워커 풀 (psycopg2 커넥션은
+# 스레드 세이프하므로 동일 커넥션에 다른 커서로 실행해도 안전)
+_db_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="db-overlap")
+
+
+def _insert_default_settings(db, user_id: int) -> None:
+    """신규 가입자의 기본 user_settings 행을 생성한다."""
+    with db.cursor() as cur:
+        cur.execute("INSERT INTO user_settings (user_id) VALUES (%s)", (user_id,))
+
 
 async def fetch_kakao_tokens(code: str) -> dict:
     """Exchange authorization code for access and refresh tokens."""
@@ -133,12 +218,12 @@ def register_user():
         return make_response({"error": "authorization code missing"}, 400)
 
     try:
-        token_info = asyncio.run(fetch_kakao_tokens(code))
+        token_info = _call_kakao(fetch_kakao_tokens(code))
         access_token = token_info.get("access_token")
         if not access_token:
             return make_response({"error": "failed to get kakao access token"}, 400)
 
-        kakao_user_info = asyncio.run(fetch_kakao_user_info(access_token))
+        kakao_user_info = _call_kakao(fetch_kakao_user_info(access_token))
 
         kakao_id = str(kakao_user_info.get("id"))
         kakao_account = kakao_user_info.get("kakao_account", {})
@@ -151,32 +236,35 @@ def register_user():
 
         db = get_db()
         with db.cursor() as cur:
+            # 신규/기존 분기를 UPSERT 하나로 처리. xmax = 0이면 새로 INSERT된 행
             cur.execute(
-                "SELECT id FROM users WHERE kakao_id = %s",
-                (kakao_id,),
+                """
+                INSERT INTO users (kakao_id, username, email, profile_image_url)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (kakao_id) DO UPDATE SET
+                    username = EXCLUDED.username,
+                    email = EXCLUDED.email,
+                    profile_image_url = EXCLUDED.profile_image_url
+                RETURNING id, (xmax = 0) AS inserted
+                """,
+                (kakao_id, username, email, profile_image_url),
+            )
+            upserted = cur.fetchone()
+            user_id = upserted["id"]
+
+        # 신규 사용자의 기본 설정 INSERT(네트워크 RTT)를 워커 스레드에 맡겨
+        # JWT HMAC 서명(CPU)과 겹쳐 실행한다 — RTT 하나가 서명 시간에 숨는다
+        settings_future = None
+        if upserted["inserted"]:
+            settings_future = _db_executor.submit(
+                _insert_default_settings, db, user_id
             )
-            existing = cur.fetchone()
-            if existing:
-                user_id = existing["id"]
-                # 기존 사용자의 프로필 정보 업데이트 (프로필 이미지 포함)
-                cur.execute(
-                    "UPDATE users SET username = %s, email = %s, profile_image_url = %s WHERE id = %s",
-                    (username, email, profile_image_url, user_id),
-                )
-            else:
-                cur.execute(
-                    "INSERT INTO users (kakao_id, username, email, profile_image_url) VALUES (%s, %s, %s, %s) RETURNING id",
-                    (kakao_id, username, email, profile_image_url),
-                )
-                user_id = cur.fetchone()["id"]
-
-                # 기본 설정 생성
-                cur.execute(
-                    "INSERT INTO user_settings (user_id) VALUES (%s)", (user_id,)
-                )
-
-            # JWT 토큰 생성
-            jwt_token = generate_jwt_token(user_id, username, email)
+
+        # JWT 토큰 생성
+        jwt_token = generate_jwt_token(user_id, username, email)
+
+        if settings_future is not None:
+            settings_future.result()
 
         return make_response(
             {
@@ -282,7 +370,7 @@ def update_user():
         if not updated:
             return make_response({"error": "user not found"}, 404)
 
-    return make_response(dict(updated))
+    return make_response(updated)
 
 
 def _remove_user(user_id: int) -> int:
@@ -324,7 +412,7 @@ def admin_list_users() -> tuple[Any, int]:
         cur.execute("SELECT id, username, email FROM users ORDER BY id")
         users = cur.fetchall()
 
-    return make_response([dict(u) for u in users])
+    return make_response(users)
 
 
 @bp.route("/admin/users/<int:user_id>", methods=["DELETE"])
@@ -509,21 +597,20 @@ def get_user_profile():
     user_id = get_current_user_id()
     db = get_db()
     with db.cursor() as cur:
-        cur.execute(
-            """
-            SELECT u.id, u.username, u.email, u.profile_image_url, u.points, u.level, u.experience_points,
-                   ul.level_name, ul.description, ul.benefits, u.created_at
-            FROM users u
-            LEFT JOIN user_levels ul ON u.level = ul.level
-            WHERE u.id = %s
-        """,
-            (user_id,),
-        )
+        cur.execute("EXECUTE get_user_profile(%s)", (user_id,))
         user = cur.fetchone()
         if not user:
             return make_response({"error": "user not found"}, 404)
 
-    return make_response(dict(user))
+    # 내용 기반 ETag로 변경 없는 재조회 시 본문 직렬화/전송을 생략
+    # (인용/파싱은 werkzeug의 set_etag/if_none_match에 맡긴다)
+    etag = hashlib.md5(repr(user).encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        return "", 304
+
+    resp, code = profile_response(user)
+    resp.set_etag(etag)
+    return resp, code
 
 
 @bp.route("/users/level", methods=["PUT"])
@@ -536,41 +623,36 @@ def update_user_level():
 
     db = get_db()
     with db.cursor() as cur:
-        # 현재 사용자 정보 조회
-        cur.execute(
-            "SELECT level, experience_points FROM users WHERE id = %s", (user_id,)
-        )
-        user = cur.fetchone()
-        if not user:
-            return make_response({"error": "user not found"}, 404)
-
-        new_exp = user["experience_points"] + experience_points
-
-        # 새로운 레벨 계산
+        # 조회/레벨 계산/업데이트를 CTE 하나로 묶어 round-trip 3회 -> 1회
         cur.execute(
             """
-            SELECT level FROM user_levels 
-            WHERE required_exp <= %s 
-            ORDER BY level DESC LIMIT 1
-        """,
-            (new_exp,),
-        )
-        level_result = cur.fetchone()
-        new_level = level_result["level"] if level_result else 1
-
-        # 사용자 정보 업데이트
-        cur.execute(
-            """
-            UPDATE users 
-            SET experience_points = %s, level = %s 
-            WHERE id = %s 
-            RETURNING level, experience_points
+            WITH cur AS (
+                SELECT level AS old_level, experience_points AS old_exp
+                FROM users WHERE id = %s
+            ),
+            new_exp AS (SELECT (old_exp + %s) AS e FROM cur),
+            new_lvl AS (
+                SELECT COALESCE(
+                    (SELECT level FROM user_levels
+                     WHERE required_exp <= (SELECT e FROM new_exp)
+                     ORDER BY level DESC LIMIT 1),
+                    1
+                ) AS l
+            )
+            UPDATE users
+            SET experience_points = (SELECT e FROM new_exp),
+                level = (SELECT l FROM new_lvl)
+            WHERE id = %s
+            RETURNING level, experience_points,
+                      (SELECT old_level FROM cur) AS old_level
         """,
-            (new_exp, new_level, user_id),
+            (user_id, experience_points, user_id),
         )
         updated = cur.fetchone()
+        if not updated:
+            return make_response({"error": "user not found"}, 404)
 
-        level_up = new_level > user["level"]
+        level_up = updated["level"] > updated["old_level"]
 
     return make_response(
         {
@@ -638,15 +720,7 @@ def update_user_score():
     db = get_db()
     with db.cursor() as cur:
         # 경험치 업데이트 (0 미만으로 내려가지 않도록 GREATEST 사용)
-        cur.execute(
-            """
-            UPDATE users
-            SET experience_points = GREATEST(0, experience_points + %s)
-            WHERE id = %s
-            RETURNING experience_points
-            """,
-            (exp_change, user_id),
-        )
+        cur.execute("EXECUTE inc_user_exp(%s, %s)", (exp_change, user_id))
 
         updated_user = cur.fetchone()
         if updated_user is None:
@@ -734,21 +808,30 @@ def get_user_settings():
     user_id = get_current_user_id()
     db = get_db()
     with db.cursor() as cur:
-        cur.execute("SELECT * FROM user_settings WHERE user_id = %s", (user_id,))
+        # 없으면 기본 설정을 생성하는 것까지 한 번의 round-trip으로 처리
+        cur.execute(
+            """
+            INSERT INTO user_settings (user_id)
+            VALUES (%s)
+            ON CONFLICT (user_id) DO NOTHING
+            RETURNING *
+        """,
+            (user_id,),
+        )
         settings = cur.fetchone()
         if not settings:
-            # 기본 설정 생성
-            cur.execute(
-                """
-                INSERT INTO user_settings (user_id) 
-                VALUES (%s) 
-                RETURNING *
-            """,
-                (user_id,),
-            )
+            # 이미 존재하는 경우 RETURNING이 비므로 SELECT로 조회
+            cur.execute("SELECT * FROM user_settings WHERE user_id = %s", (user_id,))
             settings = cur.fetchone()
 
-    return make_response(dict(settings))
+    # updated_at 기반 ETag: 설정이 안 바뀐 재조회는 304로 응답
+    etag = settings["updated_at"].isoformat()
+    if request.if_none_match.contains(etag):
+        return "", 304
+
+    resp, code = settings_response(settings)
+    resp.set_etag(etag)
+    return resp, code
 
 
 @bp.route("/users/settings", methods=["PUT"])
@@ -831,52 +914,36 @@ def update_user_settings():
 
     db = get_db()
     with db.cursor() as cur:
-        # 설정이 존재하는지 확인
-        cur.execute("SELECT id FROM user_settings WHERE user_id = %s", (user_id,))
-        existing = cur.fetchone()
-
-        if existing:
-            # 업데이트
-            cur.execute(
-                """
-                UPDATE user_settings 
-                SET notification_enabled = COALESCE(%s, notification_enabled),
-                    location_sharing = COALESCE(%s, location_sharing),
-                    privacy_level = COALESCE(%s, privacy_level),
-                    preferences = COALESCE(%s, preferences),
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE user_id = %s
-                RETURNING *
-            """,
-                (
-                    data.get("notification_enabled"),
-                    data.get("location_sharing"),
-                    data.get("privacy_level"),
-                    data.get("preferences"),
-                    user_id,
-                ),
-            )
-        else:
-            # 생성
-            cur.execute(
-                """
-                INSERT INTO user_settings 
+        # 단일 UPSERT로 INSERT/UPDATE 분기를 제거 (round-trip 1회, race 방지)
+        cur.execute(
+            """
+            INSERT INTO user_settings
                 (user_id, notification_enabled, location_sharing, privacy_level, preferences)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING *
-            """,
-                (
-                    user_id,
-                    data.get("notification_enabled", True),
-                    data.get("location_sharing", False),
-                    data.get("privacy_level", "public"),
-                    data.get("preferences"),
-                ),
-            )
+            VALUES (%s, COALESCE(%s, true), COALESCE(%s, false), COALESCE(%s, 'public'), %s)
+            ON CONFLICT (user_id) DO UPDATE SET
+                notification_enabled = COALESCE(%s, user_settings.notification_enabled),
+                location_sharing     = COALESCE(%s, user_settings.location_sharing),
+                privacy_level        = COALESCE(%s, user_settings.privacy_level),
+                preferences          = COALESCE(%s, user_settings.preferences),
+                updated_at           = CURRENT_TIMESTAMP
+            RETURNING *
+        """,
+            (
+                user_id,
+                data.get("notification_enabled"),
+                data.get("location_sharing"),
+                data.get("privacy_level"),
+                data.get("preferences"),
+                data.get("notification_enabled"),
+                data.get("location_sharing"),
+                data.get("privacy_level"),
+                data.get("preferences"),
+            ),
+        )
 
         updated = cur.fetchone()
 
-    return make_response(dict(updated))
+    return make_response(updated)
 
 
 @bp.route("/users/verifications", methods=["GET"])
@@ -888,9 +955,20 @@ def get_user_verifications():
     tags:
       - Users
     summary: 사용자 인증 내역 조회
-    description: 현재 로그인한 사용자의 인증 요청 내역을 조회합니다.
+    description: 현재 로그인한 사용자의 인증 요청 내역을 조회합니다. (커서 기반 페이지네이션)
     security:
       - JWT: []
+    parameters:
+      - in: query
+        name: before
+        type: string
+        description: 이 시각(created_at, ISO 8601) 이전의 내역만 조회 (다음 페이지 커서)
+        example: "2024-01-15T10:30:00"
+      - in: query
+        name: limit
+        type: integer
+        description: 최대 조회 건수 (기본 50)
+        example: 50
     responses:
       200:
         description: 사용자 인증 내역 조회 성공
@@ -939,19 +1017,31 @@ def get_user_verifications():
         description: 인증 실패
     """
     user_id = get_current_user_id()
+    before = request.args.get("before")
+    limit = int(request.args.get("limit", 50))
+
     db = get_db()
     with db.cursor() as cur:
+        # 커서 기반 페이지네이션: 무제한 fetchall 대신 한 페이지만 전송
+        where_clause = "WHERE user_id = %s"
+        params = [user_id]
+
+        if before:
+            where_clause += " AND created_at < %s"
+            params.append(before)
+
         cur.execute(
-            """
-            SELECT * FROM user_verifications 
-            WHERE user_id = %s 
+            f"""
+            SELECT * FROM user_verifications
+            {where_clause}
             ORDER BY created_at DESC
+            LIMIT %s
         """,
-            (user_id,),
+            params + [limit],
         )
         verifications = cur.fetchall()
 
-    return make_response([dict(v) for v in verifications])
+    return make_response(verifications)
 
 
 @bp.route("/users/verifications", methods=["POST"])
@@ -1057,7 +1147,7 @@ def create_verification():
         )
         verification = cur.fetchone()
 
-    return make_response(dict(verification), 201)
+    return make_response(verification, 201)
 
 
 @bp.route("/levels", methods=["GET"])
@@ -1117,12 +1207,7 @@ def get_all_levels():
       401:
         description: 인증 실패
     """
-    db = get_db()
-    with db.cursor() as cur:
-        cur.execute("SELECT * FROM user_levels ORDER BY level")
-        levels = cur.fetchall()
-
-    return make_response([dict(level) for level in levels])
+    return levels_response(_get_levels())
 
 
 @bp.route("/dev/test-token", methods=["GET"])
@@ -1160,72 +1245,38 @@ def get_test_token():
         description: 프로덕션 환경에서는 사용 불가
     """
     # 프로덕션 환경에서는 비활성화
-    if os.environ.get("FLASK_ENV") == "production":
+    if _IS_PROD:
         return make_response({"error": "Not available in production"}, 403)
 
     user_type = request.args.get("user_type", "user")
 
-    # 테스트용 사용자 생성/조회
-    db = get_db()
-    with db.cursor() as cur:
-        if user_type == "admin":
-            # 기존 테스트 관리자 조회
-            cur.execute(
-                """
-                SELECT id, username, email, is_admin FROM users 
-                WHERE kakao_id = 'test_admin_kakao_id'
-            """
-            )
-            user = cur.fetchone()
-
-            if not user:
-                # 새로 생성
-                cur.execute(
-                    """
-                    INSERT INTO users (kakao_id, username, email, is_admin) 
-                    VALUES ('test_admin_kakao_id', 'test_admin', 'admin@test.com', true)
-                    RETURNING id, username, email, is_admin
-                """
-                )
-                user = cur.fetchone()
-        else:
-            # 기존 테스트 사용자 조회
-            cur.execute(
-                """
-                SELECT id, username, email, is_admin FROM users 
-                WHERE kakao_id = 'test_user_kakao_id'
-            """
-            )
-            user = cur.fetchone()
-
-            if not user:
-                # 새로 생성
-                cur.execute(
-                    """
-                    INSERT INTO users (kakao_id, username, email, is_admin) 
-                    VALUES ('test_user_kakao_id', 'test_user', 'user@test.com', false)
-                    RETURNING id, username, email, is_admin
-                """
-                )
-                user = cur.fetchone()
+    if user_type == "admin":
+        params = ("test_admin_kakao_id", "test_admin", "admin@test.com", True)
+    else:
+        params = ("test_user_kakao_id", "test_user", "user@test.com", False)
 
-        user_id = user["id"]
+    # 테스트용 사용자 생성/조회를 UPSERT 하나로 처리 (round-trip 2회 -> 1회).
+    # dict 행 대신 namedtuple 행으로 받아 중간 dict 할당 없이 속성 접근만 한다.
+    db = get_db()
+    with db.cursor(cursor_factory=psycopg2.extras.NamedTupleCursor) as cur:
+        cur.execute("EXECUTE upsert_test_user(%s, %s, %s, %s)", params)
+        user = cur.fetchone()
 
     # JWT 토큰 생성 (is_admin 정보 포함)
     token = generate_jwt_token(
-        user_id=user_id,
-        username=user["username"],
-        email=user["email"],
-        is_admin=user["is_admin"],
+        user_id=user.id,
+        username=user.username,
+        email=user.email,
+        is_admin=user.is_admin,
     )
 
     return make_response(
         {
             "access_token": token,
-            "user_id": user_id,
+            "user_id": user.id,
             "user_type": user_type,
-            "username": user["username"],
-            "email": user["email"],
-            "is_admin": user["is_admin"],
+            "username": user.username,
+            "email": user.email,
+            "is_admin": user.is_admin,
         }
     )
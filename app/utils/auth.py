@@ -1,64 +1,183 @@
 """
 JWT 인증 관련 유틸리티 모듈
 """
-import jwt
+import base64
+import hashlib
+import hmac
+import json
 import os
-from datetime import datetime, timedelta
+import re
+import threading
+import time
 from functools import wraps
-from flask import request, jsonify, current_app
+from flask import request, jsonify, current_app, g
 from app.utils.responses import make_response
 
+try:  # orjson이 없으면 stdlib json으로 동작
+    import orjson
+except Exception:  # pragma: no cover - fallback when orjson is missing
+    orjson = None
+
 
 # JWT 시크릿 키 (환경변수에서 읽어오고, 없으면 기본값 사용)
 JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'your-secret-key-here-change-in-production')
+# 서명/검증마다 utf-8 인코딩을 반복하지 않도록 바이트 키를 한 번만 준비
+_JWT_SECRET_BYTES = JWT_SECRET_KEY.encode('utf-8')
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION_HOURS = 24 * 7  # 7일
+JWT_EXPIRATION_SECONDS = JWT_EXPIRATION_HOURS * 3600
+
+# HMAC-SHA256은 hmac.new(= hashlib/OpenSSL, SHA-NI 지원 CPU에서는 하드웨어
+# 경로)를 사용한다. 첫 로그인 요청이 OpenSSL lazy-init 비용을 지불하지
+# 않도록 import 시점에 한 번 워밍업해 둔다.
+hmac.new(_JWT_SECRET_BYTES, b"warmup", hashlib.sha256).digest()
+
+# 정적 JWT 헤더는 import 시점에 한 번만 base64url 인코딩
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(
+    b'{"alg":"HS256","typ":"JWT"}'
+).rstrip(b'=')
+
+
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _b64url_encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def _b64url_decode(data):
+    return base64.urlsafe_b64decode(data + b'=' * (-len(data) % 4))
 
 
 def generate_jwt_token(user_id, username=None, email=None, is_admin=False):
     """
-    JWT 토큰 생성
-    
+    JWT 토큰 생성 (HS256, OpenSSL HMAC 직접 호출)
+
     Args:
         user_id (int): 사용자 ID
         username (str): 사용자명 (선택)
         email (str): 이메일 (선택)
         is_admin (bool): 관리자 여부
-    
+
     Returns:
         str: JWT 토큰
     """
+    now = int(time.time())
     payload = {
         'user_id': user_id,
         'username': username,
         'email': email,
         'is_admin': is_admin,
-        'iat': datetime.utcnow(),
-        'exp': datetime.utcnow() + timedelta(hours=JWT_EXPIRATION_HOURS)
+        'iat': now,
+        'exp': now + JWT_EXPIRATION_SECONDS
     }
-    
-    token = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
-    return token
+
+    signing_input = _JWT_HEADER_B64 + b'.' + _b64url_encode(_json_dumps(payload))
+    signature = hmac.new(
+        _JWT_SECRET_BYTES, signing_input, hashlib.sha256
+    ).digest()
+    return (signing_input + b'.' + _b64url_encode(signature)).decode()
+
+
+# 디코드 결과 캐시: 같은 토큰의 HMAC 검증 + JSON 파싱을 TTL 동안 재사용
+_DECODE_CACHE_TTL = 60  # seconds
+_DECODE_CACHE_MAX = 4096
+_decode_cache = {}
+_decode_cache_lock = threading.Lock()
+
+
+# base64url 문자 집합 사전 검사용 — HMAC을 돌리기 전에 형식이 아닌
+# 토큰(무차별 대입 등)을 문자열 검사만으로 걸러낸다
+_B64URL_SEGMENT_RE = re.compile(rb'[A-Za-z0-9_-]+')
+
+
+def _hs256_decode(token):
+    """서명과 만료를 검증하고 페이로드를 반환한다 (실패 시 None)."""
+    try:
+        header_b64, payload_b64, sig_b64 = token.encode('ascii').split(b'.')
+    except (ValueError, UnicodeEncodeError, AttributeError):
+        return None
+
+    if not (
+        _B64URL_SEGMENT_RE.fullmatch(header_b64)
+        and _B64URL_SEGMENT_RE.fullmatch(payload_b64)
+        and _B64URL_SEGMENT_RE.fullmatch(sig_b64)
+    ):
+        return None
+
+    signing_input = header_b64 + b'.' + payload_b64
+    expected = hmac.new(
+        _JWT_SECRET_BYTES, signing_input, hashlib.sha256
+    ).digest()
+    try:
+        if not hmac.compare_digest(expected, _b64url_decode(sig_b64)):
+            return None
+        payload = _json_loads(_b64url_decode(payload_b64))
+    except Exception:
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    exp = payload.get('exp')
+    if exp is not None and exp <= time.time():
+        return None
+    return payload
 
 
 def decode_jwt_token(token):
     """
-    JWT 토큰 디코딩
-    
+    JWT 토큰 디코딩 (검증 결과는 짧은 TTL 동안 캐시)
+
     Args:
         token (str): JWT 토큰
-    
+
     Returns:
         dict: 디코딩된 페이로드 또는 None (실패 시)
     """
-    try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+    now = time.monotonic()
+    with _decode_cache_lock:
+        hit = _decode_cache.get(token)
+    if hit is not None and now - hit[1] < _DECODE_CACHE_TTL:
+        payload = hit[0]
+        # 캐시 히트라도 토큰 자체가 만료됐으면 무효
+        # (_hs256_decode와 동일하게 exp 없는 토큰은 만료 없음으로 취급)
+        exp = payload.get('exp')
+        if exp is not None and exp <= time.time():
+            with _decode_cache_lock:
+                _decode_cache.pop(token, None)
+            return None
         return payload
-    except jwt.ExpiredSignatureError:
-        return None
-    except jwt.InvalidTokenError:
+
+    payload = _hs256_decode(token)
+    if payload is None:
         return None
 
+    with _decode_cache_lock:
+        if len(_decode_cache) >= _DECODE_CACHE_MAX:
+            _decode_cache.clear()
+        _decode_cache[token] = (payload, now)
+    return payload
+
+
+def _decode_for_request(token):
+    """같은 요청 안에서 이미 검증한 토큰이면 g의 페이로드를 재사용한다."""
+    cached = getattr(g, '_jwt_decoded', None)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    payload = decode_jwt_token(token)
+    if payload is not None:
+        g._jwt_decoded = (token, payload)
+    return payload
+
 
 def get_token_from_header():
     """
@@ -68,8 +187,9 @@ def get_token_from_header():
         str: JWT 토큰 또는 None
     """
     auth_header = request.headers.get('Authorization')
-    if auth_header and auth_header.startswith('Bearer '):
-        return auth_header.split(' ')[1]
+    # split() 리스트 할당 대신 접두사 확인 후 슬라이스 한 번으로 추출
+    if auth_header is not None and len(auth_header) > 7 and auth_header[:7] == 'Bearer ':
+        return auth_header[7:]
     return None
 
 
@@ -84,17 +204,13 @@ def jwt_required(f):
         if not token:
             return make_response({"error": "Authorization token required"}, 401)
         
-        payload = decode_jwt_token(token)
+        payload = _decode_for_request(token)
         if not payload:
             return make_response({"error": "Invalid or expired token"}, 401)
         
-        # 현재 사용자 정보를 request context에 저장
-        request.current_user = {
-            'user_id': payload.get('user_id'),
-            'username': payload.get('username'),
-            'email': payload.get('email'),
-            'is_admin': payload.get('is_admin', False)
-        }
+        # 현재 사용자 정보를 request context에 저장 (페이로드가 이미
+        # user_id/username/email/is_admin 키를 갖고 있어 복사 없이 그대로 사용)
+        request.current_user = payload
         
         return f(*args, **kwargs)
     
@@ -113,7 +229,7 @@ def admin_required(f):
         if not token:
             return make_response({"error": "Authorization token required"}, 401)
         
-        payload = decode_jwt_token(token)
+        payload = _decode_for_request(token)
         if not payload:
             return make_response({"error": "Invalid or expired token"}, 401)
         
@@ -126,13 +242,9 @@ def admin_required(f):
         if not payload.get('is_admin', False):
             return make_response({"error": "Admin privileges required"}, 403)
         
-        # 현재 사용자 정보를 request context에 저장
-        request.current_user = {
-            'user_id': payload.get('user_id'),
-            'username': payload.get('username'),
-            'email': payload.get('email'),
-            'is_admin': payload.get('is_admin', False)
-        }
+        # 현재 사용자 정보를 request context에 저장 (페이로드가 이미
+        # user_id/username/email/is_admin 키를 갖고 있어 복사 없이 그대로 사용)
+        request.current_user = payload
         
         return f(*args, **kwargs)
     
@@ -1,17 +1,90 @@
+from datetime import date
+from decimal import Decimal
 from http import HTTPStatus
 from typing import Any
 
-from flask import jsonify
+from flask import current_app, jsonify
+from werkzeug.http import http_date
+
+try:  # orjson이 없는 환경에서는 stdlib json(jsonify)으로 동작
+    import orjson
+except Exception:  # pragma: no cover - fallback when orjson is missing
+    orjson = None
+
+# 매 응답마다 IntEnum 생성 + 속성 접근을 하지 않도록 미리 dict로 펼쳐 둔다
+_PHRASES = {s.value: s.phrase for s in HTTPStatus}
+
+# 가장 흔한 응답 모양은 본문 바이트를 재사용한다
+_EMPTY_OK_BODY = b'{"code":200,"message":"OK","data":[]}'
+# {"error": ...} 한 개짜리 페이로드 (인증 실패 등 반복되는 에러) 본문 캐시
+_ERROR_BODY_CACHE_MAX = 128
+_error_body_cache = {}
+
+
+# orjson은 기본적으로 datetime을 ISO 8601로 직렬화해 기존 jsonify의
+# HTTP date 형식("Wed, 01 Jan 2024 10:30:00 GMT")과 달라진다. 프런트가
+# 보는 wire format을 바꾸지 않도록 default 훅으로 넘겨 http_date로 만든다.
+_ORJSON_OPTS = orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+
+
+def _orjson_default(obj):
+    """orjson이 직접 다루지 못하거나 통과시킨 타입 처리 (datetime, Decimal 등)."""
+    if isinstance(obj, date):
+        # datetime/date 모두 Flask 기본 provider와 동일한 HTTP date 형식 유지
+        return http_date(obj)
+    if isinstance(obj, dict):
+        # psycopg RealDictRow 같은 dict 서브클래스
+        return dict(obj)
+    if isinstance(obj, Decimal):
+        # Flask 기본 JSON provider와 동일하게 문자열로 직렬화
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
 
 def make_response(data: Any = None, code: int = 200):
     """Return a standardized JSON response with data always as a list."""
     if data is None:
+        if code == 200:
+            return (
+                current_app.response_class(
+                    _EMPTY_OK_BODY, mimetype="application/json"
+                ),
+                200,
+            )
         payload = []
     elif isinstance(data, list):
         payload = data
     else:
+        if orjson is not None and isinstance(data, dict) and tuple(data) == ("error",):
+            # 반복되는 단일 에러 응답은 직렬화된 바이트를 재사용
+            key = (code, data["error"])
+            body_bytes = _error_body_cache.get(key)
+            if body_bytes is None:
+                body_bytes = orjson.dumps(
+                    {"code": code, "message": _PHRASES.get(code, ""), "data": [data]},
+                    default=_orjson_default,
+                    option=_ORJSON_OPTS,
+                )
+                if len(_error_body_cache) < _ERROR_BODY_CACHE_MAX:
+                    _error_body_cache[key] = body_bytes
+            return (
+                current_app.response_class(
+                    body_bytes, mimetype="application/json"
+                ),
+                code,
+            )
         payload = [data]
 
-    message = HTTPStatus(code).phrase
-    return jsonify({"code": code, "message": message, "data": payload}), code
+    message = _PHRASES.get(code, "")
+    body = {"code": code, "message": message, "data": payload}
+
+    if orjson is not None:
+        # orjson은 bytes를 바로 반환하므로 utf-8 인코딩 단계도 생략된다
+        return (
+            current_app.response_class(
+                orjson.dumps(body, default=_orjson_default, option=_ORJSON_OPTS),
+                mimetype="application/json",
+            ),
+            code,
+        )
+    return jsonify(body), code
@@ -0,0 +1,93 @@
+"""고정 스키마 읽기 응답용 msgspec Struct 정의.
+
+Struct는 클래스 생성 시점에 응답 모양에 특화된 C 인코더가 만들어지므로
+dict를 런타임에 순회하는 경로보다 구조화된 payload 직렬화가 빠르다.
+"""
+from typing import Optional
+
+from flask import current_app
+from werkzeug.http import http_date
+
+from .responses import _PHRASES, make_response
+
+try:  # msgspec이 없는 환경에서는 make_response 경로로 동작
+    import msgspec
+except Exception:  # pragma: no cover - fallback when msgspec is missing
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class ProfileResp(msgspec.Struct):
+        id: int
+        username: str
+        email: str
+        profile_image_url: Optional[str]
+        points: int
+        level: int
+        experience_points: int
+        level_name: Optional[str]
+        description: Optional[str]
+        benefits: Optional[str]
+        created_at: Optional[str]
+
+    class SettingsResp(msgspec.Struct):
+        id: int
+        user_id: int
+        notification_enabled: bool
+        location_sharing: bool
+        privacy_level: str
+        preferences: Optional[str]
+        updated_at: Optional[str]
+
+    class LevelResp(msgspec.Struct):
+        level: int
+        level_name: str
+        required_exp: int
+        description: Optional[str]
+        benefits: Optional[str]
+
+    _encoder = msgspec.json.Encoder()
+
+
+# msgspec은 datetime을 ISO 8601로 인코딩하지만, 나머지 엔드포인트(jsonify/
+# orjson 경로)는 모두 HTTP date 형식을 쓴다. wire format이 엇갈리지 않도록
+# Struct에 넣기 전에 같은 형식의 문자열로 맞춘다.
+def _http_date(value):
+    return http_date(value) if value is not None else None
+
+
+def _struct_response(payload, code):
+    """Struct 리스트를 표준 {code, message, data} 포맷으로 인코딩한다."""
+    body = {"code": code, "message": _PHRASES.get(code, ""), "data": payload}
+    return (
+        current_app.response_class(
+            _encoder.encode(body), mimetype="application/json"
+        ),
+        code,
+    )
+
+
+def profile_response(row, code: int = 200):
+    """/users/profile 행을 직렬화한 응답 반환."""
+    if msgspec is None:
+        return make_response(row, code)
+    return _struct_response(
+        [ProfileResp(**{**row, "created_at": _http_date(row["created_at"])})], code
+    )
+
+
+def settings_response(row, code: int = 200):
+    """/users/settings 행을 직렬화한 응답 반환."""
+    if msgspec is None:
+        return make_response(row, code)
+    return _struct_response(
+        [SettingsResp(**{**row, "updated_at": _http_date(row["updated_at"])})], code
+    )
+
+
+def levels_response(rows, code: int = 200):
+    """/levels 행 목록을 직렬화한 응답 반환."""
+    if msgspec is None:
+        return make_response(rows, code)
+    return _struct_response([LevelResp(**row) for row in rows], code)
@@ -46,7 +46,7 @@ CREATE TABLE users (
 
 CREATE TABLE user_settings (
     id SERIAL PRIMARY KEY,
-    user_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL UNIQUE,
     notification_enabled BOOLEAN DEFAULT true,
     location_sharing BOOLEAN DEFAULT false,
     privacy_level VARCHAR(50) DEFAULT 'public',
@@ -67,6 +67,10 @@ CREATE TABLE user_verifications (
     FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
 );
 
+-- 인증 내역 커서 페이지네이션용 인덱스
+CREATE INDEX idx_user_verifications_user_created
+    ON user_verifications (user_id, created_at DESC);
+
 CREATE TABLE quizzes (
     id SERIAL PRIMARY KEY,
     question TEXT NOT NULL,
@@ -167,6 +171,9 @@ CREATE TABLE rewards (
     FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
 );
 
+-- 레벨 계산 시 required_exp 범위 조회용 인덱스
+CREATE INDEX idx_user_levels_required_exp ON user_levels (required_exp);
+
 -- Insert initial user levels
 INSERT INTO user_levels (level, level_name, required_exp, description, benefits) VALUES
 (1, '초보자', 0, '자전거 여행을 시작하는 단계', '기본 퀴즈 참여 가능'),
@@ -0,0 +1,121 @@
+"""
+공용 pytest 픽스처 모음
+
+app/client는 세션에 한 번만 만들고, 각 테스트는 공유 커넥션 위의
+트랜잭션 롤백으로 격리한다. 모듈별로 다른 사용자가 필요하면 같은
+이름의 픽스처를 모듈에서 재정의해 덮어쓴다.
+"""
+import os
+
+import psycopg2
+import pytest
+
+from app import create_app
+from app.db import get_db
+
+
+def _worker_database_url():
+    """pytest-xdist 워커마다 독립된 테스트 DB URL을 돌려준다.
+
+    단일 프로세스 실행이면 기존 likebike_test를 그대로 쓰고, 워커
+    (PYTEST_XDIST_WORKER=gw0, gw1, ...)라면 워커 전용 DB를 만들어 쓴다.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        return "postgresql://localhost/likebike_test"
+    db_name = f"likebike_test_{worker}"
+    conn = psycopg2.connect("postgresql://localhost/postgres")
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (db_name,))
+        if cur.fetchone() is None:
+            # 스키마가 이미 들어있는 likebike_test를 템플릿으로 복제하면
+            # 빈 DB를 만들고 schema.sql을 처음부터 실행하는 것보다 빠르다.
+            # CREATE DATABASE는 같은 템플릿을 동시에 쓸 수 없으므로 advisory
+            # lock으로 워커 간 생성을 직렬화한다.
+            cur.execute("SELECT pg_advisory_lock(hashtext('likebike_test_template'))")
+            try:
+                cur.execute(
+                    "SELECT 1 FROM pg_database WHERE datname = 'likebike_test'"
+                )
+                if cur.fetchone() is not None:
+                    cur.execute(
+                        f'CREATE DATABASE "{db_name}" TEMPLATE likebike_test'
+                    )
+                else:
+                    cur.execute(f'CREATE DATABASE "{db_name}"')
+            finally:
+                cur.execute(
+                    "SELECT pg_advisory_unlock(hashtext('likebike_test_template'))"
+                )
+    conn.close()
+    return f"postgresql://localhost/{db_name}"
+
+
+_DATABASE_URL = _worker_database_url()
+# DATABASE_URL을 직접 지정하지 않고 앱을 만드는 테스트 모듈도 워커 DB를 쓰도록
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    os.environ["DATABASE_URL"] = _DATABASE_URL
+
+
+@pytest.fixture(scope="session")
+def app():
+    app = create_app(
+        {
+            "TESTING": True,
+            "DATABASE_URL": _DATABASE_URL,
+            "CLOVA_API_KEY": "dummy",
+        }
+    )
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def db_transaction(app):
+    """스키마는 앱 생성 시 한 번만 만들고, 테스트는 트랜잭션 롤백으로 격리한다."""
+    with app.app_context():
+        db = get_db()
+        db.rollback()
+        db.autocommit = False
+        yield
+        db.rollback()
+        db.autocommit = True
+
+
+@pytest.fixture
+def test_user(db_transaction):
+    # db_transaction이 테스트 동안 app context를 유지하므로 바로 get_db() 사용
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, false)",
+            (
+                "test_kakao_id",
+                "testuser",
+                "test@example.com",
+                "https://k.kakaocdn.net/dn/test.jpg",
+            ),
+        )
+        return cur.fetchone()["id"]
+
+
+@pytest.fixture
+def admin_user(db_transaction):
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, %s)",
+            (
+                "admin_kakao_id",
+                "admin",
+                "admin@example.com",
+                "https://k.kakaocdn.net/dn/admin.jpg",
+                True,
+            ),
+        )
+        return cur.fetchone()["id"]
@@ -1,67 +1,60 @@
-import io
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
+
+from psycopg2.extras import execute_values
+from urllib3.filepost import encode_multipart_formdata
 
 import pytest
 
-from app import create_app
 from app.db import get_db
 from tests.test_helpers import get_admin_headers, get_auth_headers, get_test_jwt_token
 
 
-@pytest.fixture
-def app():
-    app = create_app(
-        {"TESTING": True, "DATABASE_URL": "postgresql://localhost/likebike_test"}
-    )
-    return app
 
+@pytest.fixture(autouse=True)
+def mock_upload(monkeypatch):
+    """NCP 업로드를 테스트마다 자동으로 모킹한다 (네트워크 호출 차단)."""
+    m = MagicMock(return_value=("https://test.com/x.jpg", None))
+    monkeypatch.setattr("app.routes.bike_logs.upload_file_to_ncp", m)
+    return m
 
-@pytest.fixture
-def client(app):
-    return app.test_client()
 
+_FAKE_IMG = b"fake image data"
 
-@pytest.fixture
-def test_user(app):
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url) VALUES (%s, %s, %s, %s) RETURNING id",
-                (
-                    "test_kakao_id",
-                    "bikeuser",
-                    "bike@example.com",
-                    "https://k.kakaocdn.net/dn/test.jpg",
-                ),
-            )
-            return cur.fetchone()["id"]
+
+def make_multipart(description=None):
+    """고정 payload의 multipart 본문을 미리 한 번에 인코딩해 돌려준다."""
+    fields = []
+    if description is not None:
+        fields.append(("description", description))
+    fields.append(("bike_photo", ("bike.jpg", _FAKE_IMG, "image/jpeg")))
+    fields.append(("safety_gear_photo", ("safety.jpg", _FAKE_IMG, "image/jpeg")))
+    return encode_multipart_formdata(fields)
 
 
 @pytest.fixture
-def admin_user(app):
-    with app.app_context():
+def make_bike_log(test_user):
+    """요청 파이프라인을 거치지 않고 DB에 직접 활동 기록을 만드는 팩토리."""
+
+    def _make(description="테스트 라이딩", status="pending"):
         db = get_db()
         with db.cursor() as cur:
             cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url, is_admin) VALUES (%s, %s, %s, %s, %s) RETURNING id",
+                "INSERT INTO bike_usage_logs "
+                "(user_id, description, bike_photo_url, safety_gear_photo_url, verification_status) "
+                "VALUES (%s, %s, %s, %s, %s) RETURNING id",
                 (
-                    "admin_kakao_id",
-                    "admin",
-                    "admin@example.com",
-                    "https://k.kakaocdn.net/dn/admin.jpg",
-                    True,
+                    test_user,
+                    description,
+                    "https://test.com/bike.jpg",
+                    "https://test.com/safety.jpg",
+                    status,
                 ),
             )
             return cur.fetchone()["id"]
 
-
-def create_fake_image():
-    """테스트용 가짜 이미지 파일 생성"""
-    return (io.BytesIO(b"fake image data"), "test_image.jpg")
+    return _make
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
 def test_create_bike_log_success(mock_upload, client, test_user):
     """자전거 활동 기록 생성 성공 테스트"""
     # Mock 파일 업로드 성공
@@ -75,18 +68,9 @@ def test_create_bike_log_success(mock_upload, client, test_user):
     )
     headers = get_auth_headers(token)
 
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
-
+    body, content_type = make_multipart("한강 라이딩")
     res = client.post(
-        "/users/bike-logs",
-        data={
-            "description": "한강 라이딩",
-            "bike_photo": (bike_photo, "bike.jpg"),
-            "safety_gear_photo": (safety_photo, "safety.jpg"),
-        },
-        headers=headers,
-        content_type="multipart/form-data",
+        "/users/bike-logs", data=body, headers=headers, content_type=content_type
     )
 
     assert res.status_code == 201
@@ -107,17 +91,9 @@ def test_create_bike_log_missing_description(client, test_user):
     )
     headers = get_auth_headers(token)
 
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
-
+    body, content_type = make_multipart()
     res = client.post(
-        "/users/bike-logs",
-        data={
-            "bike_photo": (bike_photo, "bike.jpg"),
-            "safety_gear_photo": (safety_photo, "safety.jpg"),
-        },
-        headers=headers,
-        content_type="multipart/form-data",
+        "/users/bike-logs", data=body, headers=headers, content_type=content_type
     )
 
     assert res.status_code == 400
@@ -145,7 +121,6 @@ def test_create_bike_log_missing_photos(client, test_user):
     )
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
 def test_create_bike_log_upload_failure(mock_upload, client, test_user):
     """파일 업로드 실패 테스트"""
     # Mock 파일 업로드 실패
@@ -156,54 +131,39 @@ def test_create_bike_log_upload_failure(mock_upload, client, test_user):
     )
     headers = get_auth_headers(token)
 
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
-
+    body, content_type = make_multipart("테스트 라이딩")
     res = client.post(
-        "/users/bike-logs",
-        data={
-            "description": "테스트 라이딩",
-            "bike_photo": (bike_photo, "bike.jpg"),
-            "safety_gear_photo": (safety_photo, "safety.jpg"),
-        },
-        headers=headers,
-        content_type="multipart/form-data",
+        "/users/bike-logs", data=body, headers=headers, content_type=content_type
     )
 
     assert res.status_code == 500
     assert "업로드 실패" in res.get_json()["data"][0]["error"]
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
-def test_get_user_bike_logs(mock_upload, client, test_user):
+def test_get_user_bike_logs(client, test_user):
     """사용자 활동 기록 조회 테스트"""
-    # Mock 파일 업로드 성공
-    mock_upload.side_effect = [
-        ("https://test.com/bike1.jpg", None),
-        ("https://test.com/safety1.jpg", None),
-        ("https://test.com/bike2.jpg", None),
-        ("https://test.com/safety2.jpg", None),
-    ]
-
     token = get_test_jwt_token(
         test_user, f"user_{test_user}", f"user{test_user}@example.com"
     )
     headers = get_auth_headers(token)
 
-    # 두 개의 활동 기록 생성
-    for i in range(2):
-        bike_photo, _ = create_fake_image()
-        safety_photo, _ = create_fake_image()
-
-        client.post(
-            "/users/bike-logs",
-            data={
-                "description": f"라이딩 {i+1}",
-                "bike_photo": (bike_photo, f"bike{i+1}.jpg"),
-                "safety_gear_photo": (safety_photo, f"safety{i+1}.jpg"),
-            },
-            headers=headers,
-            content_type="multipart/form-data",
+    # 두 개의 활동 기록을 INSERT 한 번으로 생성
+    db = get_db()
+    with db.cursor() as cur:
+        execute_values(
+            cur,
+            "INSERT INTO bike_usage_logs "
+            "(user_id, description, bike_photo_url, safety_gear_photo_url, verification_status) VALUES %s",
+            [
+                (
+                    test_user,
+                    f"라이딩 {i + 1}",
+                    f"https://test.com/bike{i + 1}.jpg",
+                    f"https://test.com/safety{i + 1}.jpg",
+                    "pending",
+                )
+                for i in range(2)
+            ],
         )
 
     # 전체 목록 조회
@@ -226,36 +186,15 @@ def test_get_user_bike_logs_auth_required(client):
     assert res.status_code == 401
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
-def test_get_bike_log_detail(mock_upload, client, test_user):
+def test_get_bike_log_detail(client, test_user, make_bike_log):
     """활동 기록 상세 조회 테스트"""
-    # Mock 파일 업로드 성공
-    mock_upload.side_effect = [
-        ("https://test.com/bike.jpg", None),
-        ("https://test.com/safety.jpg", None),
-    ]
-
     token = get_test_jwt_token(
         test_user, f"user_{test_user}", f"user{test_user}@example.com"
     )
     headers = get_auth_headers(token)
 
     # 활동 기록 생성
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
-
-    res = client.post(
-        "/users/bike-logs",
-        data={
-            "description": "상세 조회 테스트",
-            "bike_photo": (bike_photo, "bike.jpg"),
-            "safety_gear_photo": (safety_photo, "safety.jpg"),
-        },
-        headers=headers,
-        content_type="multipart/form-data",
-    )
-
-    log_id = res.get_json()["data"][0]["id"]
+    log_id = make_bike_log(description="상세 조회 테스트")
 
     # 상세 조회
     res = client.get(f"/users/bike-logs/{log_id}", headers=headers)
@@ -276,12 +215,20 @@ def test_get_bike_log_detail_not_found(client, test_user):
     assert res.status_code == 404
 
 
-def test_get_pending_bike_logs_admin(client, admin_user):
-    """관리자용 검증 대기 목록 조회 테스트"""
+@pytest.fixture
+def admin_auth(admin_user):
+    """관리자 인증 헤더 한 벌을 만들어 재사용한다.
+
+    사용자 id가 테스트마다 달라지므로 모듈 범위로는 올릴 수 없지만,
+    get_test_jwt_token의 lru_cache 덕에 같은 id면 서명은 재사용된다.
+    """
     token = get_test_jwt_token(admin_user, "admin", "admin@example.com", is_admin=True)
-    headers = get_admin_headers(token)
+    return get_admin_headers(token)
 
-    res = client.get("/admin/bike-logs", headers=headers)
+
+def test_get_pending_bike_logs_admin(client, admin_auth):
+    """관리자용 검증 대기 목록 조회 테스트"""
+    res = client.get("/admin/bike-logs", headers=admin_auth)
     assert res.status_code == 200
     assert "data" in res.get_json()
 
@@ -297,47 +244,15 @@ def test_get_pending_bike_logs_non_admin(client, test_user):
     assert res.status_code == 403
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
-def test_verify_bike_log_success(mock_upload, client, test_user, admin_user):
+def test_verify_bike_log_success(client, test_user, admin_auth, make_bike_log):
     """활동 기록 검증 성공 테스트"""
-    # Mock 파일 업로드 성공
-    mock_upload.side_effect = [
-        ("https://test.com/bike.jpg", None),
-        ("https://test.com/safety.jpg", None),
-    ]
-
-    # 사용자 토큰으로 활동 기록 생성
-    user_token = get_test_jwt_token(
-        test_user, f"user_{test_user}", f"user{test_user}@example.com"
-    )
-    user_headers = get_auth_headers(user_token)
-
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
-
-    res = client.post(
-        "/users/bike-logs",
-        data={
-            "description": "검증 테스트",
-            "bike_photo": (bike_photo, "bike.jpg"),
-            "safety_gear_photo": (safety_photo, "safety.jpg"),
-        },
-        headers=user_headers,
-        content_type="multipart/form-data",
-    )
-
-    log_id = res.get_json()["data"][0]["id"]
-
-    # 관리자 토큰으로 검증
-    admin_token = get_test_jwt_token(
-        admin_user, "admin", "admin@example.com", is_admin=True
-    )
-    admin_headers = get_admin_headers(admin_token)
+    # 활동 기록 생성
+    log_id = make_bike_log(description="검증 테스트")
 
     res = client.post(
         f"/admin/bike-logs/{log_id}/verify",
         json={"status": "verified", "admin_notes": "안전 장비 착용 확인됨"},
-        headers=admin_headers,
+        headers=admin_auth,
     )
 
     assert res.status_code == 200
@@ -348,47 +263,15 @@ def test_verify_bike_log_success(mock_upload, client, test_user, admin_user):
     assert "verified_at" in data
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
-def test_verify_bike_log_reject(mock_upload, client, test_user, admin_user):
+def test_verify_bike_log_reject(client, test_user, admin_auth, make_bike_log):
     """활동 기록 거부 테스트"""
-    # Mock 파일 업로드 성공
-    mock_upload.side_effect = [
-        ("https://test.com/bike.jpg", None),
-        ("https://test.com/safety.jpg", None),
-    ]
-
-    # 사용자 토큰으로 활동 기록 생성
-    user_token = get_test_jwt_token(
-        test_user, f"user_{test_user}", f"user{test_user}@example.com"
-    )
-    user_headers = get_auth_headers(user_token)
-
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
-
-    res = client.post(
-        "/users/bike-logs",
-        data={
-            "description": "거부 테스트",
-            "bike_photo": (bike_photo, "bike.jpg"),
-            "safety_gear_photo": (safety_photo, "safety.jpg"),
-        },
-        headers=user_headers,
-        content_type="multipart/form-data",
-    )
-
-    log_id = res.get_json()["data"][0]["id"]
-
-    # 관리자 토큰으로 거부
-    admin_token = get_test_jwt_token(
-        admin_user, "admin", "admin@example.com", is_admin=True
-    )
-    admin_headers = get_admin_headers(admin_token)
+    # 활동 기록 생성
+    log_id = make_bike_log(description="거부 테스트")
 
     res = client.post(
         f"/admin/bike-logs/{log_id}/verify",
         json={"status": "rejected", "admin_notes": "안전 장비 미착용"},
-        headers=admin_headers,
+        headers=admin_auth,
     )
 
     assert res.status_code == 200
@@ -398,17 +281,12 @@ def test_verify_bike_log_reject(mock_upload, client, test_user, admin_user):
     assert data["admin_notes"] == "안전 장비 미착용"
 
 
-def test_verify_bike_log_invalid_status(client, admin_user):
+def test_verify_bike_log_invalid_status(client, admin_auth):
     """잘못된 검증 상태 테스트"""
-    admin_token = get_test_jwt_token(
-        admin_user, "admin", "admin@example.com", is_admin=True
-    )
-    admin_headers = get_admin_headers(admin_token)
-
     res = client.post(
         "/admin/bike-logs/1/verify",
         json={"status": "invalid_status"},
-        headers=admin_headers,
+        headers=admin_auth,
     )
 
     assert res.status_code == 400
@@ -419,17 +297,12 @@ def test_verify_bike_log_invalid_status(client, admin_user):
 
 
 
-def test_verify_bike_log_not_found(client, admin_user):
+def test_verify_bike_log_not_found(client, admin_auth):
     """존재하지 않는 활동 기록 검증 테스트"""
-    admin_token = get_test_jwt_token(
-        admin_user, "admin", "admin@example.com", is_admin=True
-    )
-    admin_headers = get_admin_headers(admin_token)
-
     res = client.post(
         "/admin/bike-logs/99999/verify",
         json={"status": "verified"},
-        headers=admin_headers,
+        headers=admin_auth,
     )
 
     assert res.status_code == 404
@@ -451,29 +324,21 @@ def test_verify_bike_log_non_admin(client, test_user):
     assert res.status_code == 403
 
 
-def test_bike_log_auth_required(client):
+@pytest.mark.parametrize(
+    "method,url",
+    [
+        ("post", "/users/bike-logs"),  # 활동 기록 생성
+        ("get", "/users/bike-logs"),  # 활동 기록 조회
+        ("get", "/users/bike-logs/1"),  # 활동 기록 상세 조회
+        ("get", "/admin/bike-logs"),  # 관리자 목록
+        ("post", "/admin/bike-logs/1/verify"),  # 관리자 검증
+    ],
+)
+def test_bike_log_auth_required(client, method, url):
     """인증 없이 API 호출 실패 테스트"""
-    # 활동 기록 생성
-    res = client.post("/users/bike-logs")
-    assert res.status_code == 401
-
-    # 활동 기록 조회
-    res = client.get("/users/bike-logs")
-    assert res.status_code == 401
-
-    # 활동 기록 상세 조회
-    res = client.get("/users/bike-logs/1")
-    assert res.status_code == 401
-
-    # 관리자 API
-    res = client.get("/admin/bike-logs")
-    assert res.status_code == 401
-
-    res = client.post("/admin/bike-logs/1/verify")
-    assert res.status_code == 401
+    assert getattr(client, method)(url).status_code == 401
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
 def test_daily_bike_log_limit(mock_upload, client, test_user):
     mock_upload.side_effect = [
         ("https://test.com/bike1.jpg", None),
@@ -487,43 +352,21 @@ def test_daily_bike_log_limit(mock_upload, client, test_user):
     )
     headers = get_auth_headers(token)
 
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
+    body, content_type = make_multipart("라이딩1")
     res = client.post(
-        "/users/bike-logs",
-        data={
-            "description": "라이딩1",
-            "bike_photo": (bike_photo, "bike1.jpg"),
-            "safety_gear_photo": (safety_photo, "safety1.jpg"),
-        },
-        headers=headers,
-        content_type="multipart/form-data",
+        "/users/bike-logs", data=body, headers=headers, content_type=content_type
     )
     assert res.status_code == 201
 
-    bike_photo2, _ = create_fake_image()
-    safety_photo2, _ = create_fake_image()
+    body, content_type = make_multipart("라이딩2")
     res = client.post(
-        "/users/bike-logs",
-        data={
-            "description": "라이딩2",
-            "bike_photo": (bike_photo2, "bike2.jpg"),
-            "safety_gear_photo": (safety_photo2, "safety2.jpg"),
-        },
-        headers=headers,
-        content_type="multipart/form-data",
+        "/users/bike-logs", data=body, headers=headers, content_type=content_type
     )
     assert res.status_code == 400
     assert "daily bike log limit" in res.get_json()["data"][0]["error"]
 
 
-@patch("app.routes.bike_logs.upload_file_to_ncp")
-def test_get_today_bike_log_count(mock_upload, client, test_user):
-    mock_upload.side_effect = [
-        ("https://test.com/bike.jpg", None),
-        ("https://test.com/safety.jpg", None),
-    ]
-
+def test_get_today_bike_log_count(client, test_user, make_bike_log):
     token = get_test_jwt_token(
         test_user, f"user_{test_user}", f"user{test_user}@example.com"
     )
@@ -534,18 +377,7 @@ def test_get_today_bike_log_count(mock_upload, client, test_user):
     assert res.status_code == 200
     assert res.get_json()["data"][0]["count"] == 0
 
-    bike_photo, _ = create_fake_image()
-    safety_photo, _ = create_fake_image()
-    client.post(
-        "/users/bike-logs",
-        data={
-            "description": "라이딩",
-            "bike_photo": (bike_photo, "bike.jpg"),
-            "safety_gear_photo": (safety_photo, "safety.jpg"),
-        },
-        headers=headers,
-        content_type="multipart/form-data",
-    )
+    make_bike_log(description="라이딩")
 
     res = client.get("/users/bike-logs/today/count", headers=headers)
     assert res.status_code == 200
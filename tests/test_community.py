@@ -1,39 +1,6 @@
-import pytest
-
-from app import create_app
-from app.db import get_db
 from tests.test_helpers import get_auth_headers, get_test_jwt_token
 
 
-@pytest.fixture
-def app():
-    app = create_app(
-        {"TESTING": True, "DATABASE_URL": "postgresql://localhost/likebike_test"}
-    )
-    return app
-
-
-@pytest.fixture
-def client(app):
-    return app.test_client()
-
-
-@pytest.fixture
-def test_user(app):
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url) VALUES (%s, %s, %s, %s) RETURNING id",
-                (
-                    "test_community_user",
-                    "communityuser",
-                    "community@example.com",
-                    "https://k.kakaocdn.net/dn/community.jpg",
-                ),
-            )
-            return cur.fetchone()["id"]
-
 
 def test_community_post_crud(client, test_user):
     token = get_test_jwt_token(
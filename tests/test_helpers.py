@@ -1,17 +1,22 @@
 """
 테스트를 위한 헬퍼 함수들
 """
-import os
+from functools import lru_cache
+from types import MappingProxyType
+
 from app.utils.auth import generate_jwt_token
 
 
+# 토큰 만료가 7일이라 한 번 서명한 토큰을 테스트 세션 내내 재사용해도 안전하다
+@lru_cache(maxsize=256)
 def get_test_jwt_token(user_id=1, username="test_user", email="test@example.com", is_admin=False):
-    """테스트용 JWT 토큰 생성"""
+    """테스트용 JWT 토큰 생성 (같은 인자는 서명 결과를 재사용)"""
     return generate_jwt_token(user_id, username, email, is_admin)
 
 
+@lru_cache(maxsize=256)
 def get_admin_jwt_token(user_id=999, username="admin", email="admin@example.com"):
-    """테스트용 관리자 JWT 토큰 생성"""
+    """테스트용 관리자 JWT 토큰 생성 (같은 인자는 서명 결과를 재사용)"""
     return generate_jwt_token(user_id, username, email, is_admin=True)
 
 
@@ -25,12 +30,36 @@ def get_auth_headers(token=None):
     }
 
 
-def get_admin_headers(token=None):
-    """관리자 인증 헤더 생성"""
-    if token is None:
-        token = get_admin_jwt_token()
-    return {
+@lru_cache(maxsize=256)
+def _admin_headers_for(token):
+    # 읽기 전용 매핑이라 캐시된 객체를 테스트끼리 공유해도 안전하다
+    return MappingProxyType({
         "Authorization": f"Bearer {token}",
         "X-Admin": "true",
         "Content-Type": "application/json"
-    }
+    })
+
+
+def get_admin_headers(token=None):
+    """관리자 인증 헤더 생성 (같은 토큰이면 캐시된 읽기 전용 dict 재사용)"""
+    if token is None:
+        token = get_admin_jwt_token()
+    return _admin_headers_for(token)
+
+
+# 카카오 사용자 정보 목 — 여러 테스트가 같은 응답을 쓰므로 한 번만 정의한다
+KAKAO_USER_PAYLOAD = {
+    "id": 999,
+    "kakao_account": {
+        "email": "test@kakao.com",
+        "profile": {
+            "nickname": "kakao_user",
+            "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
+        },
+    },
+}
+
+
+async def fake_kakao_fetch(access_token):
+    """fetch_kakao_user_info 대체용 고정 응답 코루틴."""
+    return KAKAO_USER_PAYLOAD
@@ -1,49 +1,32 @@
 import pytest
 
-from app import create_app
 from app.db import get_db
 from tests.test_helpers import get_test_jwt_token, get_admin_jwt_token, get_auth_headers, get_admin_headers
 
 
-@pytest.fixture
-def app():
-    app = create_app(
-        {"TESTING": True, "DATABASE_URL": "postgresql://localhost/likebike_test"}
-    )
-    return app
-
-
-@pytest.fixture
-def client(app):
-    return app.test_client()
-
 
 @pytest.fixture 
-def test_admin_user(app):
-    """테스트용 관리자 사용자 생성"""
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url, is_admin) VALUES (%s, %s, %s, %s, %s) RETURNING id",
-                ("admin_kakao_999", "admin", "admin@example.com", "https://k.kakaocdn.net/dn/admin.jpg", True),
-            )
-            user_id = cur.fetchone()["id"]
-        return user_id
+def test_admin_user(db_transaction):
+    """테스트용 관리자 사용자 생성 (db_transaction의 컨텍스트 재사용)"""
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, %s)",
+            ("admin_kakao_999", "admin", "admin@example.com", "https://k.kakaocdn.net/dn/admin.jpg", True),
+        )
+        return cur.fetchone()["id"]
 
 
 @pytest.fixture
-def test_user(app):
-    """테스트용 일반 사용자 생성"""
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url) VALUES (%s, %s, %s, %s) RETURNING id",
-                ("test_kakao_123", "testuser", "test@example.com", "https://k.kakaocdn.net/dn/user.jpg"),
-            )
-            user_id = cur.fetchone()["id"]
-        return user_id
+def test_user(db_transaction):
+    """테스트용 일반 사용자 생성 (db_transaction의 컨텍스트 재사용)"""
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, false)",
+            ("test_kakao_123", "testuser", "test@example.com", "https://k.kakaocdn.net/dn/user.jpg"),
+        )
+        return cur.fetchone()["id"]
 
 
 def test_admin_create_update_delete_news(client, test_admin_user):
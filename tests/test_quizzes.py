@@ -2,8 +2,7 @@ from datetime import date
 
 import pytest
 
-from app import create_app
-from app.db import get_db, init_db
+from app.db import get_db
 from tests.test_helpers import (
     get_admin_headers,
     get_admin_jwt_token,
@@ -13,57 +12,74 @@ from tests.test_helpers import (
 
 
 @pytest.fixture
-def app():
-    # 테스트용 PostgreSQL 데이터베이스 사용
-    app = create_app(
-        {"TESTING": True, "DATABASE_URL": "postgresql://localhost/likebike_test"}
-    )
-
-    return app
-
-
-@pytest.fixture
-def client(app):
-    return app.test_client()
-
+def test_user(db_transaction):
+    """테스트용 사용자 생성 (트랜잭션 안, 롤백으로 제거)"""
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, false)",
+            (
+                "test_kakao_123",
+                "testuser",
+                "test@example.com",
+                "https://k.kakaocdn.net/dn/quiz_user.jpg",
+            ),
+        )
+        return cur.fetchone()["id"]
+
+
+@pytest.fixture(scope="session")
+def test_admin_user(app):
+    """세션에 한 번만 만드는 관리자.
 
-@pytest.fixture
-def test_user(app):
-    """테스트용 사용자 생성"""
+    관리자 정보는 테스트 간 불변이므로 롤백 트랜잭션 밖(autocommit)에서
+    한 번 커밋해 모든 퀴즈 테스트가 같은 행을 재사용한다.
+    """
     with app.app_context():
         db = get_db()
         with db.cursor() as cur:
             cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url) VALUES (%s, %s, %s, %s) RETURNING id",
+                "EXECUTE insert_user (%s, %s, %s, %s, %s)",
                 (
-                    "test_kakao_123",
-                    "testuser",
-                    "test@example.com",
-                    "https://k.kakaocdn.net/dn/quiz_user.jpg",
+                    "quiz_admin_kakao",
+                    "quiz_admin",
+                    "quiz_admin@example.com",
+                    "https://k.kakaocdn.net/dn/admin.jpg",
+                    True,
                 ),
             )
-            user_id = cur.fetchone()["id"]
-        return user_id
+            return cur.fetchone()["id"]
 
 
 @pytest.fixture
-def test_admin_user(app):
-    """테스트용 관리자 사용자 생성"""
-    with app.app_context():
+def make_quiz(db_transaction):
+    """관리자 HTTP 경로를 거치지 않고 퀴즈를 DB에 직접 만드는 팩토리."""
+
+    def _make(
+        question="Test Question",
+        correct_answer="Test Answer",
+        answers=None,
+        hint_link="http://test_hint.com",
+        explanation="테스트 해설",
+        display_date="2024-01-01",
+    ):
         db = get_db()
         with db.cursor() as cur:
             cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url, is_admin) VALUES (%s, %s, %s, %s, %s) RETURNING id",
+                "INSERT INTO quizzes (question, correct_answer, answers, hint_link, explanation, display_date) "
+                "VALUES (%s, %s, %s, %s, %s, %s) RETURNING id",
                 (
-                    "admin_kakao_999",
-                    "admin",
-                    "admin@example.com",
-                    "https://k.kakaocdn.net/dn/admin.jpg",
-                    True,
+                    question,
+                    correct_answer,
+                    answers or ["A", "B", correct_answer],
+                    hint_link,
+                    explanation,
+                    display_date,
                 ),
             )
-            user_id = cur.fetchone()["id"]
-        return user_id
+            return cur.fetchone()["id"]
+
+    return _make
 
 
 def test_admin_create_update_delete_quiz(client, test_admin_user):
@@ -166,28 +182,20 @@ def test_user_attempt_quiz(client, test_user, test_admin_user):
     assert res.get_json()["data"]["is_correct"] is False
 
 
-def test_list_quizzes(client, test_user, test_admin_user):
+def test_list_quizzes(client, test_user, make_quiz):
     """퀴즈 목록 조회 테스트 (JWT 인증 필요) - answers와 hint_link 포함 확인"""
-    admin_headers = get_admin_headers(
-        get_admin_jwt_token(test_admin_user, "admin", "admin@example.com")
-    )
     user_headers = get_auth_headers(
         get_test_jwt_token(test_user, "testuser", "test@example.com")
     )
 
-    # 관리자가 퀴즈 생성
-    create_data = {
-        "question": "Test Question",
-        "correct_answer": "Test Answer",
-        "answers": ["A", "B", "Test Answer"],
-        "hint_link": "http://test_hint.com",
-        "explanation": "테스트 해설",
-        "display_date": "2024-01-01",
-    }
-    client.post(
-        "/admin/quizzes",
-        json=create_data,
-        headers=admin_headers,
+    # 퀴즈 생성 (관리자 HTTP 경로는 test_admin_create_update_delete_quiz가 검증)
+    make_quiz(
+        question="Test Question",
+        correct_answer="Test Answer",
+        answers=["A", "B", "Test Answer"],
+        hint_link="http://test_hint.com",
+        explanation="테스트 해설",
+        display_date="2024-01-01",
     )
 
     # 인증된 사용자는 퀴즈 목록 조회 가능하며 answers와 hint_link 포함 확인
@@ -289,7 +297,6 @@ def test_generate_quiz(client, monkeypatch, test_admin_user):
         # AI 생성 시 answers와 hint_link가 없을 수 있음을 고려
         return {"question": "dummy q", "correct_answer": "dummy a"}
 
-    monkeypatch.setenv("CLOVA_API_KEY", "dummy")
     monkeypatch.setattr("app.routes.quizzes._generate_from_clova", fake_generate)
 
     # 관리자 토큰과 헤더 생성
@@ -336,19 +343,16 @@ def test_quiz_explanation_view_and_points(client, test_user, test_admin_user):
     assert res.status_code == 201
     quiz_id = res.get_json()["data"]["id"]
 
-    # 해설 업데이트
-    with client.application.app_context():
-        from app.db import get_db
-
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "UPDATE quizzes SET explanation = %s WHERE id = %s",
-                (
-                    "헬멧은 자전거 이용 시 머리를 보호하는 필수 안전 장비입니다.",
-                    quiz_id,
-                ),
-            )
+    # 해설 업데이트 (db_transaction이 유지하는 컨텍스트의 커넥션 재사용)
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "UPDATE quizzes SET explanation = %s WHERE id = %s",
+            (
+                "헬멧은 자전거 이용 시 머리를 보호하는 필수 안전 장비입니다.",
+                quiz_id,
+            ),
+        )
 
     # 사용자가 퀴즈 정답 시도
     res = client.post(
@@ -433,16 +437,9 @@ def test_quiz_correct_answer_points_only_once(client, test_user, test_admin_user
     assert res.status_code == 201
     quiz_id = res.get_json()["data"]["id"]
 
-    # 사용자 포인트 확인
-    with client.application.app_context():
-        from app.db import get_db
-
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "SELECT experience_points FROM users WHERE id = %s", (test_user,)
-            )
-            initial_points = cur.fetchone()["experience_points"]
+    # test_user 픽스처가 방금 만든 사용자라 경험치는 스키마 기본값 0에서 시작
+    # (사전 SELECT 없이 응답의 잔액만으로 증가를 검증한다)
+    initial_points = 0
 
     # 첫 번째 정답 시도
     res = client.post(
@@ -455,15 +452,8 @@ def test_quiz_correct_answer_points_only_once(client, test_user, test_admin_user
     assert data["is_correct"] is True
     assert data["reward_given"] is True
 
-    # 경험치가 증가했는지 확인
-    with client.application.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "SELECT experience_points FROM users WHERE id = %s", (test_user,)
-            )
-            after_exp = cur.fetchone()["experience_points"]
-            assert after_exp > initial_points
+    # 응답에 담긴 잔액으로 경험치 증가를 확인 (DB 재조회 불필요)
+    assert data["experience_points_after"] > initial_points
 
     # 같은 퀴즈에 다시 정답 시도 (현재 구현상 가능하지만 포인트는 지급되지 않음)
     res = client.post(
@@ -1,64 +1,65 @@
 import io
+
+from urllib3.filepost import encode_multipart_formdata
 from unittest.mock import patch
 
 import pytest
 
-from app import create_app
 from app.db import get_db
 from tests.test_helpers import (get_admin_headers, get_auth_headers,
                                 get_test_jwt_token)
 
 
 @pytest.fixture
-def app():
-    app = create_app(
-        {"TESTING": True, "DATABASE_URL": "postgresql://localhost/likebike_test"}
-    )
-    return app
+def test_user(db_transaction):
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, false)",
+            (
+                "test_kakao_id",
+                "testuser",
+                "test@example.com",
+                "https://k.kakaocdn.net/dn/test.jpg",
+            ),
+        )
+        return cur.fetchone()["id"]
 
 
 @pytest.fixture
-def client(app):
-    return app.test_client()
+def admin_user(db_transaction):
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, %s)",
+            (
+                "admin_kakao",
+                "admin",
+                "admin@example.com",
+                "https://k.kakaocdn.net/dn/admin.jpg",
+                True,
+            ),
+        )
+        return cur.fetchone()["id"]
 
 
-@pytest.fixture
-def test_user(app):
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url) VALUES (%s, %s, %s, %s) RETURNING id",
-                (
-                    "test_kakao_id",
-                    "testuser",
-                    "test@example.com",
-                    "https://k.kakaocdn.net/dn/test.jpg",
-                ),
-            )
-            return cur.fetchone()["id"]
+# 업로드 목이 내용을 읽지 않으므로 바이트는 모듈에서 한 번만 만든다
+_FAKE_IMAGE_BYTES = b"fake"
 
 
-@pytest.fixture
-def admin_user(app):
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                "INSERT INTO users (kakao_id, username, email, profile_image_url, is_admin) VALUES (%s, %s, %s, %s, %s) RETURNING id",
-                (
-                    "admin_kakao",
-                    "admin",
-                    "admin@example.com",
-                    "https://k.kakaocdn.net/dn/admin.jpg",
-                    True,
-                ),
-            )
-            return cur.fetchone()["id"]
+def create_fake_image():
+    return (io.BytesIO(_FAKE_IMAGE_BYTES), "photo.jpg")
 
 
-def create_fake_image():
-    return (io.BytesIO(b"fake"), "photo.jpg")
+def encode_recommendation_body(location_name, photo_name):
+    """추천 코스 등록용 multipart 본문을 미리 인코딩해 (body, content_type)을 돌려준다."""
+    return encode_multipart_formdata(
+        [
+            ("location_name", location_name),
+            ("review", "굿"),
+            ("photo", (photo_name, _FAKE_IMAGE_BYTES, "image/jpeg")),
+        ]
+    )
 
 
 @patch("app.routes.recommendations.upload_file_to_ncp")
@@ -134,30 +135,23 @@ def test_weekly_recommendation_limit(mock_upload, client, test_user):
     )
     headers = get_auth_headers(token)
 
-    for i in range(2):
-        img, _ = create_fake_image()
+    # 루프에 들어가기 전에 multipart 본문을 모두 인코딩해 둔다
+    bodies = [encode_recommendation_body(f"코스{i}", f"p{i}.jpg") for i in range(2)]
+    for body, content_type in bodies:
         res = client.post(
             "/users/course-recommendations",
-            data={
-                "location_name": f"코스{i}",
-                "review": "굿",
-                "photo": (img, f"p{i}.jpg"),
-            },
+            data=body,
             headers=headers,
-            content_type="multipart/form-data",
+            content_type=content_type,
         )
         assert res.status_code == 201
 
-    img, _ = create_fake_image()
+    body, content_type = encode_recommendation_body("코스3", "p3.jpg")
     res = client.post(
         "/users/course-recommendations",
-        data={
-            "location_name": "코스3",
-            "review": "굿",
-            "photo": (img, "p3.jpg"),
-        },
+        data=body,
         headers=headers,
-        content_type="multipart/form-data",
+        content_type=content_type,
     )
     assert res.status_code == 400
     assert "weekly course recommendation limit" in res.get_json()["data"][0]["error"]
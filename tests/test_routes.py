@@ -1,13 +1,4 @@
-import pytest
 
-from app import create_app
-
-
-@pytest.fixture
-def client():
-    app = create_app({"TESTING": True})
-    with app.test_client() as client:
-        yield client
 
 
 def test_test_route(client):
@@ -1,40 +1,64 @@
-import pytest
+import json
+import time
 
-from app import create_app
-from app.db import get_db
-from tests.test_helpers import get_admin_headers, get_auth_headers, get_test_jwt_token
+import pytest
 
+from psycopg2.extras import execute_values
 
-@pytest.fixture
-def app():
-    return create_app(
-        {"TESTING": True, "DATABASE_URL": "postgresql://localhost/likebike_test"}
+from app.db import get_db
+from tests.test_helpers import (
+    fake_kakao_fetch,
+    get_admin_headers,
+    get_auth_headers,
+    get_test_jwt_token,
+)
+
+@pytest.fixture(autouse=True, scope="module")
+def patch_kakao():
+    """모듈 전체에서 카카오 호출을 고정 응답 코루틴으로 한 번만 치환한다."""
+    mp = pytest.MonkeyPatch()
+    mp.setattr("app.routes.users.fetch_kakao_user_info", fake_kakao_fetch)
+    yield
+    mp.undo()
+
+
+# 등록 요청 본문은 고정이므로 한 번만 직렬화해 둔다
+_REG_BODY = json.dumps({"access_token": "token"}).encode()
+
+
+def post_register(client):
+    """미리 인코딩한 본문으로 POST /users를 호출한다."""
+    return client.post(
+        "/users", data=_REG_BODY, content_type="application/json"
     )
 
 
 @pytest.fixture
-def client(app):
-    return app.test_client()
+def seeded_user(db_transaction):
+    """등록 HTTP 흐름 없이, DB 시딩 + 직접 서명한 토큰만으로 만든 사용자."""
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            "EXECUTE insert_user (%s, %s, %s, %s, false)",
+            (
+                "kakao_999",
+                "kakao_user",
+                "test@kakao.com",
+                "https://k.kakaocdn.net/dn/test_profile.jpg",
+            ),
+        )
+        user_id = cur.fetchone()["id"]
+    return {
+        "id": user_id,
+        "access_token": get_test_jwt_token(user_id, "kakao_user", "test@kakao.com"),
+    }
+
 
 
-def test_register_user(client, monkeypatch, app):
+def test_register_user(client):
     """사용자 등록/로그인 테스트 (JWT 토큰 발급 확인)"""
 
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
-    res = client.post("/users", json={"access_token": "token"})
+    res = post_register(client)
     assert res.status_code == 201
     data = res.get_json()["data"][0]
     assert "access_token" in data
@@ -43,35 +67,18 @@ def test_register_user(client, monkeypatch, app):
     assert data["profile_image_url"] == "https://k.kakaocdn.net/dn/test_profile.jpg"
 
 
-def test_update_user_profile(client, monkeypatch, app):
+def test_update_user_profile(client):
     """사용자 프로필 수정 테스트 (JWT 인증 필요)"""
 
     # 먼저 사용자 등록
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
     # 사용자 등록 후 JWT 토큰 획득
-    res = client.post("/users", json={"access_token": "token"})
+    res = post_register(client)
     user_data = res.get_json()["data"][0]
     user_id = user_data["id"]
     jwt_token = user_data["access_token"]
 
     # JWT 토큰으로 프로필 수정 (프로필 이미지 포함)
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Content-Type": "application/json",
-    }
+    headers = get_auth_headers(jwt_token)
     res = client.put(
         "/users/profile",
         json={
@@ -86,73 +93,44 @@ def test_update_user_profile(client, monkeypatch, app):
     assert data["profile_image_url"] == "https://k.kakaocdn.net/dn/updated_profile.jpg"
 
 
-def test_delete_user_profile(client, monkeypatch, app):
+def test_delete_user_profile(client):
     """사용자 계정 삭제 테스트 (JWT 인증 필요)"""
 
     # 먼저 사용자 등록
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
     # 사용자 등록 후 JWT 토큰 획득
-    res = client.post("/users", json={"access_token": "token"})
+    res = post_register(client)
     jwt_token = res.get_json()["data"][0]["access_token"]
 
     # JWT 토큰으로 계정 삭제
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    headers = get_auth_headers(jwt_token)
     res = client.delete("/users/profile", headers=headers)
     assert res.status_code == 204
 
 
-def test_withdraw_user(client, monkeypatch):
+def test_withdraw_user(client):
     """신규 회원 탈퇴 엔드포인트 테스트"""
 
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
-    res = client.post("/users", json={"access_token": "token"})
+    res = post_register(client)
     jwt_token = res.get_json()["data"][0]["access_token"]
 
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    headers = get_auth_headers(jwt_token)
     res = client.delete("/users/withdraw", headers=headers)
     assert res.status_code == 204
 
 
-def test_admin_delete_user(client, app):
+def test_admin_delete_user(client):
     """관리자가 특정 사용자를 삭제할 수 있어야 합니다."""
-    # 테스트용 사용자 생성
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO users (kakao_id, username, email)
-                VALUES (%s, %s, %s) RETURNING id
-                """,
-                ("admin_delete_kakao", "delete_target", "delete_target@test.com"),
-            )
-            user_id = cur.fetchone()["id"]
+    # 테스트용 사용자 생성 (db_transaction이 유지하는 컨텍스트 재사용)
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (kakao_id, username, email)
+            VALUES (%s, %s, %s) RETURNING id
+            """,
+            ("admin_delete_kakao", "delete_target", "delete_target@test.com"),
+        )
+        user_id = cur.fetchone()["id"]
 
     # 관리자 토큰으로 삭제 요청
     headers = get_admin_headers()
@@ -160,26 +138,23 @@ def test_admin_delete_user(client, app):
     assert res.status_code == 204
 
     # 사용자가 실제로 삭제되었는지 확인
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute("SELECT id FROM users WHERE id = %s", (user_id,))
-            assert cur.fetchone() is None
+    with db.cursor() as cur:
+        cur.execute("SELECT id FROM users WHERE id = %s", (user_id,))
+        assert cur.fetchone() is None
 
 
-def test_admin_list_users(client, app):
+def test_admin_list_users(client):
     """관리자가 모든 사용자를 조회할 수 있어야 합니다."""
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO users (kakao_id, username, email)
-                VALUES (%s, %s, %s) RETURNING id
-                """,
-                ("admin_list_kakao", "list_target", "list_target@test.com"),
-            )
-            user_id = cur.fetchone()["id"]
+    db = get_db()
+    with db.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO users (kakao_id, username, email)
+            VALUES (%s, %s, %s) RETURNING id
+            """,
+            ("admin_list_kakao", "list_target", "list_target@test.com"),
+        )
+        user_id = cur.fetchone()["id"]
 
     headers = get_admin_headers()
     res = client.get("/admin/users", headers=headers)
@@ -193,30 +168,11 @@ def test_admin_list_users(client, app):
     )
 
 
-def test_get_user_profile(client, monkeypatch, app):
+def test_get_user_profile(client, seeded_user):
     """사용자 프로필 조회 테스트 (JWT 인증 필요)"""
 
-    # 먼저 사용자 등록
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
-    # 사용자 등록 후 JWT 토큰 획득
-    res = client.post("/users", json={"access_token": "token"})
-    jwt_token = res.get_json()["data"][0]["access_token"]
-
-    # JWT 토큰으로 프로필 조회
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    # 등록 HTTP 흐름은 test_register_user가 검증하므로 토큰만 직접 발급
+    headers = get_auth_headers(seeded_user["access_token"])
     res = client.get("/users/profile", headers=headers)
     assert res.status_code == 200
     data = res.get_json()["data"][0]
@@ -225,128 +181,79 @@ def test_get_user_profile(client, monkeypatch, app):
     assert "profile_image_url" in data
 
 
-def test_unauthorized_access(client):
+@pytest.mark.parametrize(
+    "method, payload",
+    [
+        ("get", None),
+        ("put", {"username": "test"}),
+        ("delete", None),
+    ],
+)
+def test_unauthorized_access(client, method, payload):
     """JWT 토큰 없이 인증이 필요한 엔드포인트 접근 테스트"""
-    # 토큰 없이 프로필 조회 시도
-    res = client.get("/users/profile")
+    res = getattr(client, method)("/users/profile", json=payload)
     assert res.status_code == 401
     assert "Authorization token required" in res.get_json()["data"][0]["error"]
 
-    # 토큰 없이 프로필 수정 시도
-    res = client.put("/users/profile", json={"username": "test"})
-    assert res.status_code == 401
-
-    # 토큰 없이 계정 삭제 시도
-    res = client.delete("/users/profile")
-    assert res.status_code == 401
-
 
 def test_invalid_token_access(client):
     """잘못된 JWT 토큰으로 접근 테스트"""
-    headers = {
-        "Authorization": "Bearer invalid_token",
-        "Content-Type": "application/json",
-    }
+    headers = get_auth_headers("invalid_token")
 
     res = client.get("/users/profile", headers=headers)
     assert res.status_code == 401
     assert "Invalid or expired token" in res.get_json()["data"][0]["error"]
 
 
-def test_logout(client, monkeypatch):
+def test_logout(client, seeded_user):
     """로그아웃 테스트"""
 
-    # 사용자 등록
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
-    res = client.post("/users", json={"access_token": "token"})
-    jwt_token = res.get_json()["data"][0]["access_token"]
-
-    # 로그아웃
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    headers = get_auth_headers(seeded_user["access_token"])
     res = client.post("/users/logout", headers=headers)
     assert res.status_code == 200
     assert "Successfully logged out" in res.get_json()["data"][0]["message"]
 
 
-def test_token_refresh(client, monkeypatch):
+def test_token_refresh(client, monkeypatch, seeded_user):
     """토큰 새로고침 테스트"""
-    import time
-
-    # 사용자 등록
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
-    res = client.post("/users", json={"access_token": "token"})
-    old_token = res.get_json()["data"][0]["access_token"]
+    old_token = seeded_user["access_token"]
 
-    # 시간을 조금 지연시켜 다른 iat를 가지도록 함
-    time.sleep(1)
+    # 실제로 1초를 기다리는 대신 토큰 발급에 쓰이는 시계를 앞으로 돌려
+    # 다른 iat를 가지도록 한다 (monkeypatch가 테스트 후 원복)
+    real_time = time.time
+    monkeypatch.setattr("app.utils.auth.time.time", lambda: real_time() + 2)
 
     # 토큰 새로고침
-    headers = {"Authorization": f"Bearer {old_token}"}
+    headers = get_auth_headers(old_token)
     res = client.post("/users/refresh", headers=headers)
     assert res.status_code == 200
     new_token = res.get_json()["data"][0]["access_token"]
     assert new_token != old_token  # 새로운 토큰이 생성되어야 함
 
 
-def test_get_user_rewards(client, monkeypatch, app):
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
+def seed_rewards(user_id, rows):
+    """(source_type, points, reward_reason) 목록을 한 번의 INSERT로 시딩한다."""
+    db = get_db()
+    with db.cursor() as cur:
+        inserted = execute_values(
+            cur,
+            "INSERT INTO rewards (user_id, source_type, points, reward_reason) "
+            "VALUES %s RETURNING id",
+            [(user_id, *row) for row in rows],
+            fetch=True,
+        )
+    return [r["id"] for r in inserted]
 
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
 
-    res = client.post("/users", json={"access_token": "token"})
+def test_get_user_rewards(client):
+    res = post_register(client)
     data = res.get_json()["data"][0]
     jwt_token = data["access_token"]
     user_id = data["id"]
 
-    with app.app_context():
-        db = get_db()
-        with db.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO rewards (user_id, source_type, points, reward_reason)
-                VALUES (%s, %s, %s, %s) RETURNING id
-                """,
-                (user_id, "test", 5, "테스트"),
-            )
-            reward_id = cur.fetchone()["id"]
-
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    reward_id = seed_rewards(user_id, [("test", 5, "테스트")])[0]
+
+    headers = get_auth_headers(jwt_token)
     res = client.get("/users/rewards", headers=headers)
     assert res.status_code == 200
     rewards = res.get_json()["data"]
@@ -355,27 +262,13 @@ def test_get_user_rewards(client, monkeypatch, app):
     assert rewards[0]["points"] == 5
 
 
-def test_update_user_score_records_reward(client, monkeypatch, app):
-    async def fake_fetch(token: str):
-        return {
-            "id": 999,
-            "kakao_account": {
-                "email": "test@kakao.com",
-                "profile": {
-                    "nickname": "kakao_user",
-                    "profile_image_url": "https://k.kakaocdn.net/dn/test_profile.jpg",
-                },
-            },
-        }
-
-    monkeypatch.setattr("app.routes.users.fetch_kakao_user_info", fake_fetch)
-
-    res = client.post("/users", json={"access_token": "token"})
+def test_update_user_score_records_reward(client):
+    res = post_register(client)
     data = res.get_json()["data"][0]
     jwt_token = data["access_token"]
     user_id = data["id"]
 
-    headers = {"Authorization": f"Bearer {jwt_token}"}
+    headers = get_auth_headers(jwt_token)
     res = client.put(
         "/users/score",
         json={"experience_points": 10, "reward_reason": "테스트 경험치"},